@@ -35,6 +35,7 @@ def create_app():
     from routes.details import bp as details_bp
     from routes.media import bp as media_bp
     from routes.comments import bp as comments_bp
+    from routes.images import bp as images_bp
 
     app.register_blueprint(search_bp)
     app.register_blueprint(discover_bp)
@@ -43,6 +44,7 @@ def create_app():
     app.register_blueprint(details_bp)
     app.register_blueprint(media_bp)
     app.register_blueprint(comments_bp)
+    app.register_blueprint(images_bp)
 
     return app
 
@@ -0,0 +1,171 @@
+# backend/asgi.py
+"""
+Async (ASGI) serving mode for the TMDb proxy routes.
+
+Exposes the same /api/search, /api/discover, /api/trending, /api/details and
+/api/media contracts as the Flask app, but runs on an event loop with a pooled
+httpx.AsyncClient, so one worker can hold many concurrent upstream waits.
+
+    hypercorn asgi:app --bind 0.0.0.0:5001
+    # or: uvicorn asgi:app --port 5001
+
+Account, comment and image routes stay on the WSGI app (app.py).
+"""
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+import httpx
+from dotenv import load_dotenv
+from quart import Quart, jsonify, request
+from quart_cors import cors
+
+# Load env before importing routes: they read TMDB_API_KEY at import time
+load_dotenv(dotenv_path=Path(__file__).parent / ".env")
+
+from shared_cache import cache, make_key  # noqa: E402
+from routes import search_proxy, discovery_proxy, trending as trending_routes, media  # noqa: E402
+from routes import details  # noqa: E402
+from routes.details import build_details_request  # noqa: E402
+
+TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "1000"))
+
+app = cors(Quart(__name__))
+log = logging.getLogger(__name__)
+_client: httpx.AsyncClient | None = None
+
+
+@app.before_serving
+async def open_client():
+    global _client
+    _client = httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=100),
+    )
+
+
+@app.after_serving
+async def close_client():
+    await _client.aclose()
+
+
+def _upstream_failed():
+    # httpx errors can carry the request URL, api_key included: log, don't echo
+    log.exception("TMDb request failed")
+    return {"error": "TMDb request failed"}
+
+
+_INVALID_JSON = {"error": "TMDb returned invalid JSON"}
+
+
+def _ok(v):
+    return v[1] == 200
+
+
+async def proxy(build, prefix, ttl):
+    """
+    Validate args with a route's build_*_request and relay the TMDb response.
+    Goes through the same shared-cache lease as the WSGI routes, so concurrent
+    identical requests across all workers cause a single upstream call.
+    """
+    if not TMDB_API_KEY:
+        return jsonify({"error": "TMDB_API_KEY missing"}), 500
+    try:
+        url, params = build(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async def fetch():
+        try:
+            r = await _client.get(url, params=params)
+            return [r.json(), r.status_code]
+        except httpx.HTTPError:
+            return [_upstream_failed(), 502]
+        except ValueError:
+            return [_INVALID_JSON, 502]
+
+    body, status = await cache.aget_or_set(make_key(prefix, url, params), fetch, ttl, should_cache=_ok)
+    return jsonify(body), status
+
+
+@app.get("/api/hello")
+async def hello():
+    return jsonify({"message": "Hello from Quart!"})
+
+
+@app.get("/api/search")
+async def search():
+    return await proxy(search_proxy.build_search_request, "search", search_proxy.CACHE_TTL)
+
+
+@app.get("/api/discover")
+async def discover():
+    return await proxy(discovery_proxy.build_discover_request, "discover", discovery_proxy.CACHE_TTL)
+
+
+@app.get("/api/trending")
+async def trending():
+    return await proxy(trending_routes.build_trending_request, "trending", trending_routes.CACHE_TTL)
+
+
+@app.get("/api/details")
+async def get_details():
+    if not TMDB_API_KEY:
+        return jsonify({"error": "TMDB_API_KEY not configured"}), 500
+    try:
+        url, params = build_details_request(
+            request.args.get("type"),
+            request.args.get("id"),
+            request.args.get("language", "en-US"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async def fetch():
+        try:
+            r = await _client.get(url, params=params)
+        except httpx.HTTPError:
+            return [_upstream_failed(), 502]
+        if r.status_code != 200:
+            return [{"error": "TMDb error", "status": r.status_code}, 502]
+        try:
+            return [r.json(), 200]
+        except ValueError:
+            return [_INVALID_JSON, 502]
+
+    # Same key and [body, status] shape as routes.details.fetch_details
+    body, status = await cache.aget_or_set(
+        make_key("details", url, params), fetch, details.CACHE_TTL, should_cache=_ok
+    )
+    return jsonify(body), status
+
+
+@app.get("/api/media")
+async def get_media():
+    try:
+        (url_videos, videos_params), (url_images, images_params) = media.build_media_requests(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    async def fetch():
+        # Videos and images are independent, fetch them concurrently
+        try:
+            videos, imgs = await asyncio.gather(
+                _client.get(url_videos, params=videos_params), _client.get(url_images, params=images_params)
+            )
+            return media.shape_media(videos.json(), imgs.json())
+        except httpx.HTTPError:
+            return _upstream_failed()
+        except ValueError:
+            return _INVALID_JSON
+
+    # Same key and value shape as routes.media; errors have no trailers/backdrops, so aren't cached
+    data = await cache.aget_or_set(
+        make_key("media", url_videos, videos_params), fetch, media.CACHE_TTL,
+        should_cache=lambda v: bool(v.get("trailers") or v.get("backdrops")),
+    )
+    if "error" in data:
+        return jsonify(data), 502
+    return jsonify(data)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import time
 from functools import wraps
 from typing import Callable, Optional
 
@@ -11,11 +13,15 @@ from firebase_admin import auth as fb_auth
 from firebase_admin import credentials
 
 from db import get_session
+from shared_cache import cache
 from models import User
 
 
 _firebase_inited = False
 
+# Upper bound for reusing a verified token's claims across requests/workers
+TOKEN_CACHE_TTL = 300  # seconds
+
 
 def init_firebase():
     global _firebase_inited
@@ -59,6 +65,15 @@ def require_auth(fn: Callable):
             return jsonify({"error": "Missing Authorization Bearer token"}), 401
 
         token = auth_header.split(" ", 1)[1].strip()
+
+        # Claims of recently verified tokens are shared by all workers on the host;
+        # the user row was already synced when the token was first verified
+        cache_key = "token:" + hashlib.sha256(token.encode()).hexdigest()
+        cached = cache.get(cache_key)
+        if cached and cached.get("exp", 0) > time.time():
+            g.user = cached["user"]
+            return fn(*args, **kwargs)
+
         try:
             decoded = fb_auth.verify_id_token(token)
         except Exception as e:
@@ -92,6 +107,11 @@ def require_auth(fn: Callable):
                 if changed:
                     db.add(user)
 
+        exp = decoded.get("exp", 0)
+        ttl = min(TOKEN_CACHE_TTL, exp - time.time())
+        if ttl > 0:
+            cache.set(cache_key, {"user": g.user, "exp": exp}, ttl)
+
         return fn(*args, **kwargs)
 
     return wrapper
@@ -0,0 +1,131 @@
+# backend/bench.py
+"""
+Compare the threaded (WSGI) and async (ASGI) serving modes of the proxy routes.
+
+1) Start a fake TMDb that answers every request after a fixed delay:
+       python bench.py upstream --port 9000 --delay 0.2
+
+2) Start both servers against it (one worker each):
+       export TMDB_BASE_URL=http://127.0.0.1:9000/3 TMDB_API_KEY=bench
+       gunicorn -w 1 --threads 32 -b 127.0.0.1:5000 app:app
+       hypercorn -w 1 -b 127.0.0.1:5001 asgi:app
+
+3) Load both and compare:
+       python bench.py load --url threaded=http://127.0.0.1:5000 \\
+           --url async=http://127.0.0.1:5001 --concurrency 500 --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+# {i} makes every request unique, so the shared cache never answers and each
+# request really waits on the (fake) upstream
+DEFAULT_PATHS = [
+    "/api/trending?type=movie&window=day&page={i}",
+    "/api/search?type=movie&query=inception&page={i}",
+    "/api/discover?type=tv&year=2020&page={i}",
+    "/api/media?type=movie&id={i}",
+]
+
+_FAKE_BODY = json.dumps({"page": 1, "results": [], "total_pages": 1, "total_results": 0}).encode()
+
+
+async def _fake_tmdb(reader, writer, delay):
+    """Minimal keep-alive HTTP/1.1 responder standing in for TMDb."""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            # Drain headers
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            await asyncio.sleep(delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(_FAKE_BODY)).encode() + b"\r\n\r\n" + _FAKE_BODY
+            )
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_upstream(port, delay):
+    server = await asyncio.start_server(
+        lambda r, w: _fake_tmdb(r, w, delay), "127.0.0.1", port, backlog=4096
+    )
+    print(f"fake TMDb on http://127.0.0.1:{port}/3 (delay {delay}s)")
+    async with server:
+        await server.serve_forever()
+
+
+async def run_load(base_url, paths, concurrency, total):
+    latencies = []
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    # Fresh ids per run, so a second server doesn't hit what the first one cached
+    offset = int(time.time() * 1000)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        async def one(i):
+            nonlocal errors
+            async with sem:
+                start = time.perf_counter()
+                try:
+                    r = await client.get(paths[i % len(paths)].format(i=offset + i))
+                    if r.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    up = sub.add_parser("upstream", help="serve a fake TMDb with fixed latency")
+    up.add_argument("--port", type=int, default=9000)
+    up.add_argument("--delay", type=float, default=0.2)
+
+    load = sub.add_parser("load", help="load one or more servers and compare")
+    load.add_argument("--url", action="append", required=True, help="label=http://host:port")
+    load.add_argument("--path", action="append", help="request path, may contain {i} (repeatable)")
+    load.add_argument("--concurrency", type=int, default=200)
+    load.add_argument("--requests", type=int, default=2000)
+
+    args = parser.parse_args()
+    if args.cmd == "upstream":
+        asyncio.run(run_upstream(args.port, args.delay))
+        return
+
+    paths = args.path or DEFAULT_PATHS
+    print(f"{'mode':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for spec in args.url:
+        label, _, url = spec.rpartition("=")
+        res = asyncio.run(run_load(url, paths, args.concurrency, args.requests))
+        print(f"{label or url:<12}{res['rps']:>10.1f}{res['p50_ms']:>10.1f}{res['p99_ms']:>10.1f}{res['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
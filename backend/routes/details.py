@@ -1,28 +1,49 @@
 # backend/routes/details.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import logging
 import os
 import requests
 
+from shared_cache import cache, make_key
+
 bp = Blueprint("details", __name__, url_prefix="/api")
+log = logging.getLogger(__name__)
 
-TMDB_BASE = "https://api.themoviedb.org/3"
+TMDB_BASE = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 
+BATCH_MAX_ITEMS = 100
+BATCH_CONCURRENCY = int(os.getenv("DETAILS_BATCH_CONCURRENCY", "8"))
+CACHE_TTL = int(os.getenv("DETAILS_CACHE_TTL", "600"))  # seconds
 
-@bp.get("/details")
-def get_details():
-    """Proxy TMDb movie/TV details with extra info."""
-    if not TMDB_API_KEY:
-        return jsonify({"error": "TMDB_API_KEY not configured"}), 500
+# Pooled session + bounded worker pool shared by all batch requests
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=BATCH_CONCURRENCY))
+_pool = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix="details")
+
+
+def build_details_request(media_type, tmdb_id, language="en-US"):
+    """
+    Validate details params and return (url, params) for TMDb.
+    Raises ValueError with a client-facing message on bad input.
+    """
+    # Batch items come from arbitrary JSON, so reject non-scalar values up front
+    if media_type is not None and not isinstance(media_type, str):
+        raise ValueError("type must be movie|tv")
+    if tmdb_id is not None and (isinstance(tmdb_id, bool) or not isinstance(tmdb_id, (str, int))):
+        raise ValueError("id must be a string or integer")
+    if language is not None and not isinstance(language, str):
+        raise ValueError("language must be a string")
 
-    media_type = (request.args.get("type") or "").lower()
-    tmdb_id = request.args.get("id")
-    language = request.args.get("language", "en-US")
+    media_type = (media_type or "").lower()
+    tmdb_id = str(tmdb_id or "").strip()
 
     if media_type not in {"movie", "tv"}:
-        return jsonify({"error": "type must be movie|tv"}), 400
+        raise ValueError("type must be movie|tv")
     if not tmdb_id:
-        return jsonify({"error": "id is required"}), 400
+        raise ValueError("id is required")
 
     # Choose TMDb path by media type
     path = f"/movie/{tmdb_id}" if media_type == "movie" else f"/tv/{tmdb_id}"
@@ -30,12 +51,158 @@ def get_details():
     # Ask TMDb for extra data (credits, videos, recommendations)
     params = {
       "api_key": TMDB_API_KEY,
-      "language": language,
+      "language": language or "en-US",
       "append_to_response": "credits,videos,recommendations",
     }
+    return TMDB_BASE + path, params
+
+
+def cached_details(url, params):
+    """Return cached TMDb details for a build_details_request() result, or None."""
+    hit = cache.get(make_key("details", url, params))
+    return hit[0] if hit else None
+
+
+def fetch_details(media_type, tmdb_id, language="en-US", http=requests):
+    """
+    Return (body, status) for one title, serving from cache when possible.
+    Raises ValueError on bad params (see build_details_request).
+    """
+    url, params = build_details_request(media_type, tmdb_id, language)
+
+    def fetch():
+        try:
+            r = http.get(url, params=params, timeout=10)
+        except requests.RequestException:
+            # The exception text contains the request URL, api_key included
+            log.exception("TMDb details request failed")
+            return [{"error": "TMDb request failed"}, 502]
+        if r.status_code != 200:
+            return [{"error": "TMDb error", "status": r.status_code}, 502]
+        # Decode here: JSONDecodeError is a ValueError, which callers treat as bad params
+        try:
+            return [r.json(), 200]
+        except ValueError:
+            return [{"error": "TMDb returned invalid JSON"}, 502]
+
+    # Shared across worker processes; only successful lookups are stored
+    body, status = cache.get_or_set(
+        make_key("details", url, params), fetch, CACHE_TTL, should_cache=lambda v: v[1] == 200
+    )
+    return body, status
+
+
+@bp.get("/details")
+def get_details():
+    """Proxy TMDb movie/TV details with extra info."""
+    if not TMDB_API_KEY:
+        return jsonify({"error": "TMDB_API_KEY not configured"}), 500
+
+    try:
+        body, status = fetch_details(
+            request.args.get("type"),
+            request.args.get("id"),
+            request.args.get("language", "en-US"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(body), status
+
+
+def _parse_item(item):
+    """Accept {"type": ..., "id": ...} or [type, id]."""
+    if isinstance(item, dict):
+        media_type, tmdb_id = item.get("type"), item.get("id")
+    elif isinstance(item, (list, tuple)) and len(item) == 2:
+        media_type, tmdb_id = item
+    else:
+        raise ValueError("item must be {type, id} or [type, id]")
+
+    if not isinstance(media_type, str):
+        raise ValueError("type must be movie|tv")
+    if isinstance(tmdb_id, bool) or not isinstance(tmdb_id, (str, int)):
+        raise ValueError("id must be a string or integer")
+    return media_type, tmdb_id
+
+
+def _batch_item(index, item, language):
+    """Resolve one batch entry into a result dict (never raises)."""
+    result = {"index": index}
+    try:
+        media_type, tmdb_id = _parse_item(item)
+        result.update(type=media_type, id=tmdb_id)
+        body, status = fetch_details(media_type, tmdb_id, language, http=_session)
+    except ValueError as e:
+        result.update(error=str(e), status=400)
+        return result
+
+    if status == 200:
+        result["data"] = body
+    else:
+        result.update(error=body.get("error"), status=body.get("status", status))
+    return result
+
+
+def _cached_item(index, item, language):
+    """Result dict for a cache hit, or None if the item has to be fetched."""
+    try:
+        media_type, tmdb_id = _parse_item(item)
+        data = cached_details(*build_details_request(media_type, tmdb_id, language))
+    except ValueError:
+        return None  # let _batch_item report the error
+    if data is None:
+        return None
+    return {"index": index, "type": media_type, "id": tmdb_id, "data": data}
+
+
+@bp.post("/details/batch")
+def get_details_batch():
+    """
+    POST /api/details/batch[?stream=1]
+    body: {"items": [{"type": "movie", "id": 27205}, ["tv", 1399], ...], "language": "en-US"}
+          (or just the bare items list)
+
+    Cached titles are answered immediately; the rest are fetched from TMDb
+    with bounded concurrency. Each result carries its own error/status.
+    With stream=1 results are sent as NDJSON lines in completion order.
+    """
+    if not TMDB_API_KEY:
+        return jsonify({"error": "TMDB_API_KEY not configured"}), 500
+
+    data = request.get_json(silent=True) or {}
+    if isinstance(data, list):
+        data = {"items": data}
+    if not isinstance(data, dict):
+        return jsonify({"error": "body must be an object or a list of items"}), 400
+    items = data.get("items")
+    language = data.get("language") or request.args.get("language", "en-US")
+    stream = request.args.get("stream", "").lower() in {"1", "true"}
+
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "items must be a non-empty list"}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({"error": f"at most {BATCH_MAX_ITEMS} items per batch"}), 400
+
+    # Answer cache hits right away, only misses go to the worker pool
+    results = [_cached_item(i, item, language) for i, item in enumerate(items)]
+    futures = [
+        _pool.submit(_batch_item, i, item, language)
+        for i, item in enumerate(items)
+        if results[i] is None
+    ]
+
+    if stream:
+        def generate():
+            for res in results:
+                if res is not None:
+                    yield json.dumps(res) + "\n"
+            for fut in as_completed(futures):
+                yield json.dumps(fut.result()) + "\n"
 
-    r = requests.get(TMDB_BASE + path, params=params, timeout=10)
-    if r.status_code != 200:
-        return jsonify({"error": "TMDb error", "status": r.status_code}), 502
+        return Response(generate(), mimetype="application/x-ndjson")
 
-    return jsonify(r.json())
+    for fut in futures:
+        res = fut.result()
+        results[res["index"]] = res
+    return jsonify({"results": results})
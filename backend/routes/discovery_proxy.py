@@ -3,38 +3,41 @@ import os
 import requests
 from flask import Blueprint, request, jsonify
 
+from shared_cache import cache, make_key
+
 bp = Blueprint("tmdb_discover", __name__, url_prefix="/api")
-TMDB = "https://api.themoviedb.org/3"
+TMDB = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
 API_KEY = os.getenv("TMDB_API_KEY")
+CACHE_TTL = 600  # seconds
 
 def with_key(params=None):
     params = params or {}
     params["api_key"] = API_KEY
     return params
 
-@bp.get("/discover")
-def discover():
-    if not API_KEY:
-        return jsonify({"error": "TMDB_API_KEY missing"}), 500
-
-    media_type = request.args.get("type", "movie")
+def build_discover_request(args):
+    """
+    Validate /api/discover query args and return (url, params) for TMDb.
+    Raises ValueError with a client-facing message on bad input.
+    """
+    media_type = args.get("type", "movie")
     if media_type not in ("movie", "tv"):
-        return jsonify({"error": "type must be movie|tv"}), 400
+        raise ValueError("type must be movie|tv")
 
     path = f"{TMDB}/discover/{media_type}"
     params = {}
 
     # Basic filters
-    params["language"] = request.args.get("language", "en-US")
-    params["region"] = request.args.get("region", "US")
-    params["include_adult"] = request.args.get("include_adult", "false")
-    params["sort_by"] = request.args.get("sort_by", "popularity.desc")
-    params["page"] = request.args.get("page", 1)
-    if g := request.args.get("with_genres"):
+    params["language"] = args.get("language", "en-US")
+    params["region"] = args.get("region", "US")
+    params["include_adult"] = args.get("include_adult", "false")
+    params["sort_by"] = args.get("sort_by", "popularity.desc")
+    params["page"] = args.get("page", 1)
+    if g := args.get("with_genres"):
         params["with_genres"] = g
 
     # Year filter
-    year = request.args.get("year")
+    year = args.get("year")
     if year:
         if media_type == "movie":
             params["year"] = year
@@ -42,8 +45,8 @@ def discover():
             params["first_air_date_year"] = year
 
     # ✅ New: release date range
-    from_date = request.args.get("fromDate")
-    to_date = request.args.get("toDate")
+    from_date = args.get("fromDate")
+    to_date = args.get("toDate")
 
     if from_date:
         if media_type == "movie":
@@ -57,5 +60,22 @@ def discover():
         else:
             params["first_air_date.lte"] = to_date
 
-    r = requests.get(path, params=with_key(params), timeout=10)
-    return jsonify(r.json()), r.status_code
+    return path, with_key(params)
+
+@bp.get("/discover")
+def discover():
+    if not API_KEY:
+        return jsonify({"error": "TMDB_API_KEY missing"}), 500
+    try:
+        path, params = build_discover_request(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def fetch():
+        r = requests.get(path, params=params, timeout=10)
+        return [r.json(), r.status_code]
+
+    body, status = cache.get_or_set(
+        make_key("discover", path, params), fetch, CACHE_TTL, should_cache=lambda v: v[1] == 200
+    )
+    return jsonify(body), status
@@ -0,0 +1,183 @@
+# backend/routes/images.py
+import io
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from flask import Blueprint, jsonify, send_file
+
+bp = Blueprint("images", __name__, url_prefix="/api/img")
+
+TMDB_IMG = "https://image.tmdb.org/t/p"
+
+# On-disk cache under backend directory by default
+CACHE_DIR = Path(os.getenv("IMG_CACHE_DIR") or Path(__file__).resolve().parent.parent / "img_cache")
+CACHE_MAX_BYTES = int(os.getenv("IMG_CACHE_MAX_MB", "512")) * 1024 * 1024
+ONE_YEAR = 365 * 24 * 3600
+
+# Sizes TMDb's CDN serves (plus the ones the frontend already uses)
+ALLOWED_SIZES = {
+    "w92", "w154", "w185", "w200", "w300", "w342", "w500", "w780", "w1280",
+    "h632", "original",
+}
+# TMDb file paths are a single flat file name, e.g. "/kqjL17yufvn9OVLyXYpvtyrFfak.jpg"
+_FILE_RE = re.compile(r"^[A-Za-z0-9_-]+\.(jpg|jpeg|png|webp|svg)$")
+
+# Sizes warmed when a title is favorited (Favorites page + MovieCard)
+POSTER_PREFETCH_SIZES = ("w200", "w300")
+
+# Full directory scans are expensive (tens of thousands of files), so each process
+# keeps a running estimate and only rescans when it crosses the limit or every
+# _RESCAN_EVERY stores; the rescan also picks up what other workers wrote.
+_RESCAN_EVERY = 200
+_lock = threading.Lock()
+_est_bytes = None  # None until the first scan
+_stores = 0
+_prefetcher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="img-prefetch")
+
+
+def _cache_path(size: str, filename: str) -> Path:
+    return CACHE_DIR / size / filename
+
+
+def _normalize(size: str, path: str):
+    """Return (size, filename) if valid, else None."""
+    filename = (path or "").lstrip("/")
+    if size not in ALLOWED_SIZES or not _FILE_RE.match(filename):
+        return None
+    return size, filename
+
+
+def _cached_files():
+    """(mtime, size, path) for every stored image; in-flight .tmp dotfiles are skipped."""
+    entries = []
+    for p in CACHE_DIR.glob("*/*"):
+        if p.name.startswith("."):
+            continue
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    return entries
+
+
+def _evict_if_needed(added: int):
+    """Account for a stored image; evict least-recently-used ones when over the limit."""
+    global _est_bytes, _stores
+    with _lock:
+        _stores += 1
+        if (
+            _est_bytes is not None
+            and _est_bytes + added <= CACHE_MAX_BYTES
+            and _stores % _RESCAN_EVERY
+        ):
+            _est_bytes += added
+            return
+
+        entries = _cached_files()
+        total = sum(e[1] for e in entries)
+        if total <= CACHE_MAX_BYTES:
+            _est_bytes = total
+            return
+
+        # mtime is bumped on every hit, so oldest mtime == least recently used
+        entries.sort()
+        target = int(CACHE_MAX_BYTES * 0.9)
+        for _, size, p in entries:
+            if total <= target:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        _est_bytes = total
+
+
+def _touch(path: Path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def fetch_to_cache(size: str, filename: str):
+    """
+    Download an image from TMDb and store it in the cache.
+    Returns the image bytes, or the upstream status code on failure.
+    """
+    try:
+        r = requests.get(f"{TMDB_IMG}/{size}/{filename}", timeout=10)
+    except requests.RequestException:
+        return 502
+    if r.status_code != 200:
+        return r.status_code
+
+    dest = _cache_path(size, filename)
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file then rename, so readers never see partial images
+        tmp = dest.with_name(f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(r.content)
+        os.replace(tmp, dest)
+        _evict_if_needed(len(r.content))
+    except OSError:
+        pass  # caching is best effort, the caller still gets the bytes
+    return r.content
+
+
+def _prefetch(size: str, filename: str):
+    if not _cache_path(size, filename).exists():
+        fetch_to_cache(size, filename)
+
+
+def prefetch_poster(poster_path: str | None):
+    """Warm the cache for a poster in the background (fire and forget)."""
+    for size in POSTER_PREFETCH_SIZES:
+        key = _normalize(size, poster_path)
+        if key and not _cache_path(*key).exists():
+            _prefetcher.submit(_prefetch, *key)
+
+
+def _immutable(resp):
+    resp.cache_control.public = True
+    resp.cache_control.immutable = True
+    return resp
+
+
+@bp.get("/<size>/<path:path>")
+def get_image(size: str, path: str):
+    """
+    /api/img/w500/kqjL17yufvn9OVLyXYpvtyrFfak.jpg
+    Serve a TMDb image from the local cache, fetching it on a miss.
+    """
+    key = _normalize(size, path)
+    if not key:
+        return jsonify({"error": "invalid image size or path"}), 400
+
+    dest = _cache_path(*key)
+    try:
+        # send_file uses wsgi.file_wrapper (sendfile under gunicorn) and handles Range/ETag.
+        # It opens the file right away, so eviction after this point can't break the response.
+        resp = send_file(dest, conditional=True, max_age=ONE_YEAR)
+        _touch(dest)
+        return _immutable(resp)
+    except FileNotFoundError:
+        pass  # miss, or evicted by another worker since
+
+    result = fetch_to_cache(*key)
+    if isinstance(result, int):
+        status = 404 if result == 404 else 502
+        return jsonify({"error": "TMDb image error", "status": result}), status
+
+    # Serve the downloaded bytes directly; the cached copy may already be evicted
+    resp = send_file(
+        io.BytesIO(result), download_name=key[1], conditional=True, max_age=ONE_YEAR,
+        etag=f"{key[0]}-{key[1]}",
+    )
+    resp.headers.pop("Content-Disposition", None)
+    return _immutable(resp)
@@ -2,23 +2,35 @@ from flask import Blueprint, request, jsonify
 import requests
 import os
 
+from shared_cache import cache, make_key
+
 bp = Blueprint("media", __name__, url_prefix="/api/media")
 
 TMDB_KEY = os.getenv("TMDB_API_KEY")
-BASE = "https://api.themoviedb.org/3"
+BASE = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
+CACHE_TTL = 3600  # seconds
 
 
-@bp.get("")
-def get_media():
-    media_type = request.args.get("type", "movie")
-    tmdb_id = request.args.get("id")
+def build_media_requests(args):
+    """
+    Validate /api/media query args and return
+    ((videos_url, videos_params), (images_url, images_params)) for TMDb.
+    Raises ValueError with a client-facing message on bad input.
+    """
+    media_type = args.get("type", "movie")
+    tmdb_id = args.get("id")
 
     if not tmdb_id:
-        return jsonify({"error": "id required"}), 400
+        raise ValueError("id required")
+
+    videos = (f"{BASE}/{media_type}/{tmdb_id}/videos", {"api_key": TMDB_KEY, "language": "en-US"})
+    images = (f"{BASE}/{media_type}/{tmdb_id}/images", {"api_key": TMDB_KEY})
+    return videos, images
 
-    # Fetch videos
-    url_videos = f"{BASE}/{media_type}/{tmdb_id}/videos?api_key={TMDB_KEY}&language=en-US"
-    videos = requests.get(url_videos).json().get("results", [])
+
+def shape_media(videos_raw, imgs_raw):
+    """Build the /api/media response from TMDb videos + images payloads."""
+    videos = videos_raw.get("results", [])
 
     # Filter YouTube trailers
     yt_trailers = [
@@ -26,13 +38,32 @@ def get_media():
         if v["site"] == "YouTube" and v["type"] in ("Trailer", "Teaser")
     ]
 
-    # Fetch images
-    url_images = f"{BASE}/{media_type}/{tmdb_id}/images?api_key={TMDB_KEY}"
-    imgs_raw = requests.get(url_images).json()
-
     backdrops = imgs_raw.get("backdrops", [])[:20]   # 取前 20 张
 
-    return jsonify({
+    return {
         "trailers": yt_trailers,
         "backdrops": backdrops,
-    })
+    }
+
+
+@bp.get("")
+def get_media():
+    try:
+        (url_videos, videos_params), (url_images, images_params) = build_media_requests(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def fetch():
+        # Fetch videos
+        videos_raw = requests.get(url_videos, params=videos_params).json()
+
+        # Fetch images
+        imgs_raw = requests.get(url_images, params=images_params).json()
+
+        return shape_media(videos_raw, imgs_raw)
+
+    # Empty results may be an upstream error, don't pin them for an hour
+    return jsonify(cache.get_or_set(
+        make_key("media", url_videos, videos_params), fetch, CACHE_TTL,
+        should_cache=lambda v: bool(v["trailers"] or v["backdrops"]),
+    ))
@@ -3,32 +3,33 @@ import os
 import requests
 from flask import Blueprint, request, jsonify
 
+from shared_cache import cache, make_key
+
 bp = Blueprint("tmdb_search", __name__, url_prefix="/api")
-TMDB = "https://api.themoviedb.org/3"
+TMDB = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
 API_KEY = os.getenv("TMDB_API_KEY")
+CACHE_TTL = 300  # seconds
 
 def with_key(params: dict | None = None):
     params = params or {}
     params["api_key"] = API_KEY
     return params
 
-@bp.get("/search")
-def search():
+def build_search_request(args):
     """
-    /api/search?type=movie|tv&query=Inception&page=1&language=en-US&year=2010
+    Validate /api/search query args and return (url, params) for TMDb.
+    Raises ValueError with a client-facing message on bad input.
     """
-    media_type = request.args.get("type", "movie")  # movie | tv
-    query = request.args.get("query", "").strip()
-    page = request.args.get("page", 1)
-    language = request.args.get("language", "en-US")
-    year = request.args.get("year")  # 电影可用 year，电视剧用 first_air_date_year
+    media_type = args.get("type", "movie")  # movie | tv
+    query = args.get("query", "").strip()
+    page = args.get("page", 1)
+    language = args.get("language", "en-US")
+    year = args.get("year")  # 电影可用 year，电视剧用 first_air_date_year
 
-    if not API_KEY:
-        return jsonify({"error": "TMDB_API_KEY missing"}), 500
     if not query:
-        return jsonify({"error": "query required"}), 400
+        raise ValueError("query required")
     if media_type not in ("movie", "tv"):
-        return jsonify({"error": "type must be movie|tv"}), 400
+        raise ValueError("type must be movie|tv")
 
     path = f"{TMDB}/search/{media_type}"
     params = {
@@ -44,5 +45,25 @@ def search():
         else:
             params["first_air_date_year"] = year
 
-    r = requests.get(path, params=with_key(params), timeout=10)
-    return jsonify(r.json()), r.status_code
+    return path, with_key(params)
+
+@bp.get("/search")
+def search():
+    """
+    /api/search?type=movie|tv&query=Inception&page=1&language=en-US&year=2010
+    """
+    if not API_KEY:
+        return jsonify({"error": "TMDB_API_KEY missing"}), 500
+    try:
+        path, params = build_search_request(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def fetch():
+        r = requests.get(path, params=params, timeout=10)
+        return [r.json(), r.status_code]
+
+    body, status = cache.get_or_set(
+        make_key("search", path, params), fetch, CACHE_TTL, should_cache=lambda v: v[1] == 200
+    )
+    return jsonify(body), status
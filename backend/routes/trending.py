@@ -3,28 +3,30 @@ import os
 import requests
 from flask import Blueprint, request, jsonify
 
+from shared_cache import cache, make_key
+
 bp = Blueprint("trending", __name__, url_prefix="/api")
 
-TMDB_BASE = "https://api.themoviedb.org/3"
+TMDB_BASE = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+CACHE_TTL = 900  # seconds
 
 
-@bp.route("/trending")
-def trending():
-    """Proxy TMDb /trending endpoint."""
-    if not TMDB_API_KEY:
-        return jsonify({"error": "TMDB_API_KEY missing"}), 500
-
-    media_type = request.args.get("type", "all")  # all | movie | tv
-    time_window = request.args.get("window", "day")  # day | week
-    page = request.args.get("page", 1)
-    language = request.args.get("language", "en-US")
-    region = request.args.get("region", "US")
+def build_trending_request(args):
+    """
+    Validate /api/trending query args and return (url, params) for TMDb.
+    Raises ValueError with a client-facing message on bad input.
+    """
+    media_type = args.get("type", "all")  # all | movie | tv
+    time_window = args.get("window", "day")  # day | week
+    page = args.get("page", 1)
+    language = args.get("language", "en-US")
+    region = args.get("region", "US")
 
     if media_type not in ("all", "movie", "tv"):
-        return jsonify({"error": "type must be all|movie|tv"}), 400
+        raise ValueError("type must be all|movie|tv")
     if time_window not in ("day", "week"):
-        return jsonify({"error": "window must be day|week"}), 400
+        raise ValueError("window must be day|week")
 
     url = f"{TMDB_BASE}/trending/{media_type}/{time_window}"
     params = {
@@ -33,10 +35,27 @@ def trending():
         "language": language,
         "region": region,
     }
+    return url, params
 
-    try:
-        resp = requests.get(url, params=params, timeout=10)
-    except requests.RequestException as e:
-        return jsonify({"error": str(e)}), 502
 
-    return jsonify(resp.json()), resp.status_code
+@bp.route("/trending")
+def trending():
+    """Proxy TMDb /trending endpoint."""
+    if not TMDB_API_KEY:
+        return jsonify({"error": "TMDB_API_KEY missing"}), 500
+    try:
+        url, params = build_trending_request(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def fetch():
+        try:
+            resp = requests.get(url, params=params, timeout=10)
+        except requests.RequestException as e:
+            return [{"error": str(e)}, 502]
+        return [resp.json(), resp.status_code]
+
+    body, status = cache.get_or_set(
+        make_key("trending", url, params), fetch, CACHE_TTL, should_cache=lambda v: v[1] == 200
+    )
+    return jsonify(body), status
@@ -6,6 +6,7 @@ from flask import Blueprint, jsonify, request, g
 from auth import require_auth
 from db import get_session
 from models import User, Favorite, AlertPreference
+from routes.images import prefetch_poster
 
 
 bp = Blueprint("user", __name__, url_prefix="/api")
@@ -152,6 +153,9 @@ def add_favorite():
         )
         db.add(fav)
         db.flush()
+
+        # Warm the image cache so the Favorites page loads from local disk
+        prefetch_poster(fav.poster_path)
         return jsonify({"ok": True, "id": fav.id}), 201
 
 
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+
+# SQLite cache file under backend directory by default; shared by every
+# worker process on the host (WAL mode allows concurrent readers + one writer)
+CACHE_PATH = Path(os.getenv("SHARED_CACHE_PATH") or Path(__file__).parent / "cache.db")
+CACHE_MAX_BYTES = int(os.getenv("SHARED_CACHE_MAX_MB", "64")) * 1024 * 1024
+
+# Value encoding: 1 flag byte + compact JSON, zlib-compressed above a threshold
+_FLAG_RAW = b"\x00"
+_FLAG_ZLIB = b"\x01"
+_COMPRESS_MIN = 1024
+
+# Only rewrite accessed_at when it is this stale, so hits stay read-only
+_TOUCH_INTERVAL = 60
+_PRUNE_EVERY = 100
+_LEASE_SECONDS = 15
+_LEASE_POLL = 0.05
+
+
+def encode(value: Any) -> bytes:
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(raw) >= _COMPRESS_MIN:
+        return _FLAG_ZLIB + zlib.compress(raw, 6)
+    return _FLAG_RAW + raw
+
+
+def decode(blob: bytes) -> Any:
+    flag, payload = blob[:1], blob[1:]
+    if flag == _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return json.loads(payload)
+
+
+def make_key(prefix: str, url: str, params: Optional[dict] = None) -> str:
+    """Stable key for an upstream request; an api_key entry in params is left out."""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "api_key")
+    digest = hashlib.sha1(json.dumps([url, items]).encode()).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+class SharedCache:
+    """Size-bounded TTL cache in a local SQLite file, safe across threads and processes."""
+
+    def __init__(self, path: Path = CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._sets = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread, and a fresh one after fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_entries_accessed ON entries (accessed_at);
+                CREATE TABLE IF NOT EXISTS leases (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                """
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # Every public operation swallows sqlite3.Error (locked past the busy timeout,
+    # read-only/full disk, corrupt file): the cache then acts as a miss/no-op and
+    # callers fall through to the upstream, as if there were no cache at all.
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None on a miss/expired entry."""
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            blob, expires_at, accessed_at = row
+            if expires_at < now:
+                return None
+            if accessed_at < now - _TOUCH_INTERVAL:
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return decode(blob)
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None
+
+    def set(self, key: str, value: Any, ttl: float):
+        now = time.time()
+        blob = encode(value)
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(key) + len(blob), now + ttl, now),
+            )
+        except sqlite3.Error:
+            return
+        self._sets += 1
+        if self._sets % _PRUNE_EVERY == 0:
+            self.prune()
+
+    def delete(self, key: str):
+        try:
+            self._conn().execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def prune(self):
+        """Drop expired entries, then least-recently-used ones until under max_bytes."""
+        try:
+            conn = self._conn()
+            conn.execute("DELETE FROM entries WHERE expires_at < ?", (time.time(),))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            target = int(self.max_bytes * 0.9)
+            rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+            evict = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                evict.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", evict)
+        except sqlite3.Error:
+            pass
+
+    def _acquire_lease(self, key: str, owner: str) -> Optional[bool]:
+        """True if we now hold the lease, False if someone else does, None if the cache is unusable."""
+        now = time.time()
+        try:
+            cur = self._conn().execute(
+                """
+                INSERT INTO leases (key, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE leases.expires_at < ?
+                """,
+                (key, owner, now + _LEASE_SECONDS, now),
+            )
+        except sqlite3.Error:
+            return None
+        return cur.rowcount == 1
+
+    def _lease_held(self, key: str) -> bool:
+        try:
+            row = self._conn().execute(
+                "SELECT 1 FROM leases WHERE key = ? AND expires_at >= ?", (key, time.time())
+            ).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None
+
+    def _release_lease(self, key: str, owner: str):
+        try:
+            self._conn().execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+        except sqlite3.Error:
+            pass
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl: float,
+        should_cache: Callable[[Any], bool] = lambda v: True,
+    ) -> Any:
+        """
+        Return the cached value, or compute it with factory() and store it.
+        Only one caller per key (across all processes) holds the lease and runs
+        factory; the others wait for its result. If the holder finishes without
+        caching (should_cache rejected the value) or its lease runs out, each
+        waiter runs factory itself rather than queueing for the lease.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        owner = f"{os.getpid()}:{threading.get_ident()}"
+        acquired = self._acquire_lease(key, owner)
+        if not acquired:
+            if acquired is False:
+                while True:
+                    time.sleep(_LEASE_POLL)
+                    value = self.get(key)
+                    if value is not None:
+                        return value
+                    if not self._lease_held(key):
+                        break
+
+            # Lease gone with nothing cached (or no usable cache): compute directly
+            value = factory()
+            if should_cache(value):
+                self.set(key, value, ttl)
+            return value
+
+        try:
+            # Someone may have filled it between our miss and the lease
+            value = self.get(key)
+            if value is not None:
+                return value
+            value = factory()
+            if should_cache(value):
+                self.set(key, value, ttl)
+            return value
+        finally:
+            self._release_lease(key, owner)
+
+    async def aget_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float,
+        should_cache: Callable[[Any], bool] = lambda v: True,
+    ) -> Any:
+        """
+        get_or_set for coroutines (the ASGI app): same cross-process lease, with
+        SQLite calls run in a worker thread. Concurrent callers for one key in
+        this process share a single attempt, so only one of them polls the lease.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._aget_or_set(key, factory, ttl, should_cache))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: a disconnecting client must not cancel the fetch others wait on
+        return await asyncio.shield(task)
+
+    async def _aget_or_set(self, key, factory, ttl, should_cache):
+        value = await asyncio.to_thread(self.get, key)
+        if value is not None:
+            return value
+
+        # Coroutines hop between threads, so the owner can't be pid:thread
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        acquired = await asyncio.to_thread(self._acquire_lease, key, owner)
+        if not acquired:
+            if acquired is False:
+                while True:
+                    await asyncio.sleep(_LEASE_POLL)
+                    value = await asyncio.to_thread(self.get, key)
+                    if value is not None:
+                        return value
+                    if not await asyncio.to_thread(self._lease_held, key):
+                        break
+
+            # Lease gone with nothing cached (or no usable cache): compute directly
+            value = await factory()
+            if should_cache(value):
+                await asyncio.to_thread(self.set, key, value, ttl)
+            return value
+
+        try:
+            value = await asyncio.to_thread(self.get, key)
+            if value is not None:
+                return value
+            value = await factory()
+            if should_cache(value):
+                await asyncio.to_thread(self.set, key, value, ttl)
+            return value
+        finally:
+            await asyncio.to_thread(self._release_lease, key, owner)
+
+
+cache = SharedCache()
@@ -12,7 +12,7 @@ export default function MovieCard({
   const date = type === 'movie' ? item.release_date : item.first_air_date;
 
   const poster = item.poster_path
-    ? `https://image.tmdb.org/t/p/w300${item.poster_path}`
+    ? `/api/img/w300${item.poster_path}`
     : 'https://via.placeholder.com/300x450?text=No+Image';
 
   const detailPath = `/detail/${type}/${item.id}`;
@@ -161,11 +161,11 @@ export default function Detail() {
   const year = date ? date.slice(0, 4) : '—';
 
   const poster = data.poster_path
-    ? `https://image.tmdb.org/t/p/w500${data.poster_path}`
+    ? `/api/img/w500${data.poster_path}`
     : 'https://via.placeholder.com/500x750?text=No+Image';
 
   const backdrop = data.backdrop_path
-    ? `https://image.tmdb.org/t/p/w1280${data.backdrop_path}`
+    ? `/api/img/w1280${data.backdrop_path}`
     : null;
 
   const genres = data.genres || [];
@@ -291,7 +291,7 @@ export default function Detail() {
                   <div className="latest-season-poster">
                     {latestSeason.poster_path ? (
                       <img
-                        src={`https://image.tmdb.org/t/p/w185${latestSeason.poster_path}`}
+                        src={`/api/img/w185${latestSeason.poster_path}`}
                         alt={latestSeason.name}
                         loading="lazy"
                       />
@@ -335,7 +335,7 @@ export default function Detail() {
                     >
                       {c.profile_path ? (
                         <img
-                          src={`https://image.tmdb.org/t/p/w185${c.profile_path}`}
+                          src={`/api/img/w185${c.profile_path}`}
                           alt={c.name}
                           loading="lazy"
                         />
@@ -424,7 +424,7 @@ export default function Detail() {
                     {visibleImages.map((b, idx) => (
                       <img
                         key={idx}
-                        src={`https://image.tmdb.org/t/p/w780${b.file_path}`}
+                        src={`/api/img/w780${b.file_path}`}
                         alt="still"
                         className="backdrop-img"
                       />
@@ -36,7 +36,7 @@ export default function Favorites() {
       <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fill, 200px)', gap: 16 }}>
         {items.map((it) => (
           <div key={`${it.media_type}-${it.tmdb_id}`} style={{ width: 200 }}>
-            <img alt={it.title} src={it.poster_path ? `https://image.tmdb.org/t/p/w200${it.poster_path}` : 'https://via.placeholder.com/200x300?text=No+Image'} style={{ width: '100%', borderRadius: 8 }} />
+            <img alt={it.title} src={it.poster_path ? `/api/img/w200${it.poster_path}` : 'https://via.placeholder.com/200x300?text=No+Image'} style={{ width: '100%', borderRadius: 8 }} />
             <div style={{ marginTop: 6 }}>
               <strong>{it.title}</strong>
             </div>